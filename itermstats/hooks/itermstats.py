@@ -2,30 +2,48 @@ from base64 import b64encode
 from os import environ, remove
 from tempfile import NamedTemporaryFile
 
-try:
-    import cairosvg
-    from pygal import Config, Pie
-    from pygal.style import Style
-    IMPORTS = True
-except ImportError:
-    IMPORTS = False
-
 from bundlewrap.utils import LOG
 
-if IMPORTS:
-    STYLE = Style(
-        background='transparent',
-        opacity=1,
-        plot_background='transparent',
-        colors=('#00ae19', '#25ff44', '#ffde00', '#c90000'),
-    )
+# populated by _load_dependencies() on first use
+_DEPS = {}
+
+
+def _load_dependencies():
+    """
+    Imports pygal and cairosvg only once we actually draw a chart, since
+    they are slow to import and not needed outside of iTerm.
+    Returns None if they are missing.
+    """
+    if "loaded" not in _DEPS:
+        try:
+            import cairosvg
+            from pygal import Config, Pie
+            from pygal.style import Style
+        except ImportError:
+            _DEPS["loaded"] = False
+        else:
+            _DEPS.update({
+                'cairosvg': cairosvg,
+                'Config': Config,
+                'Pie': Pie,
+                'STYLE': Style(
+                    background='transparent',
+                    opacity=1,
+                    plot_background='transparent',
+                    colors=('#00ae19', '#25ff44', '#ffde00', '#c90000'),
+                ),
+            })
+            _DEPS["loaded"] = True
+    return _DEPS if _DEPS["loaded"] else None
+
 
 def node_apply_end(repo, node, duration=None, interactive=None, result=None, **kwargs):
     if environ.get('TERM_PROGRAM', None) != "iTerm.app" or not interactive:
         LOG.debug("skipping iTerm stats (wrong terminal)")
         return
 
-    if not IMPORTS:
+    deps = _load_dependencies()
+    if deps is None:
         LOG.error("failed to import dependencies of itermstats plugin")
         return
 
@@ -33,20 +51,20 @@ def node_apply_end(repo, node, duration=None, interactive=None, result=None, **k
     css_file.write(".text-overlay { display: none; }")
     css_file.close()
 
-    config = Config(
+    config = deps['Config'](
         height=150,
-        style=STYLE,
+        style=deps['STYLE'],
         width=350,
     )
     config.css.append(css_file.name)
 
-    chart = Pie(config)
+    chart = deps['Pie'](config)
     chart.add('correct', result.correct)
     chart.add('fixed', result.fixed)
     chart.add('skipped', result.skipped)
     chart.add('failed', result.failed)
 
-    png_data = cairosvg.svg2png(bytestring=chart.render())
+    png_data = deps['cairosvg'].svg2png(bytestring=chart.render())
     png_data_b64 = b64encode(png_data)
 
     remove(css_file.name)
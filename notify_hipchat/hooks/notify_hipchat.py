@@ -1,23 +1,25 @@
-try:
-    from configparser import SafeConfigParser
-except ImportError:
-    from ConfigParser import SafeConfigParser
 from json import dumps
 from os.path import exists, join
 
-try:
-    from requests import post
-    from requests.exceptions import ConnectionError
-    REQUESTS = True
-except ImportError:
-    REQUESTS = False
-
 from bundlewrap.utils import LOG
 
+# repo path -> parsed config (or None if disabled/unusable),
+# so each bw invocation reads the config file only once
+_CONFIGS = {}
+
+
+def _config_parser():
+    # imported lazily to keep bw startup fast when this plugin is idle
+    try:
+        from configparser import SafeConfigParser
+    except ImportError:
+        from ConfigParser import SafeConfigParser
+    return SafeConfigParser()
+
 
 def _create_config(path):
     LOG.debug("writing initial config for HipChat notifications to .hipchat_secrets.cfg")
-    config = SafeConfigParser()
+    config = _config_parser()
     config.add_section("configuration")
     config.set("configuration", "enabled", "unconfigured")
     config.add_section("connection")
@@ -34,10 +36,16 @@ def _create_config(path):
 
 
 def _get_config(repo_path):
+    if repo_path not in _CONFIGS:
+        _CONFIGS[repo_path] = _load_config(repo_path)
+    return _CONFIGS[repo_path]
+
+
+def _load_config(repo_path):
     config_path = join(repo_path, ".hipchat_secrets.cfg")
     if not exists(config_path):
         _create_config(config_path)
-    config = SafeConfigParser()
+    config = _config_parser()
     config.read(config_path)
     if config.get("configuration", "enabled") == "unconfigured":
         LOG.error("HipChat notifications not configured. Please edit .hipchat_secrets.cfg "
@@ -47,7 +55,9 @@ def _get_config(repo_path):
     elif config.get("configuration", "enabled").lower() not in ("yes", "true", "1"):
         LOG.debug("HipChat notifications not enabled in .hipchat_secrets.cfg, skipping...")
         return None
-    elif not REQUESTS:
+    try:
+        import requests  # noqa
+    except ImportError:
         LOG.error("HipChat notifications need the requests library. "
                   "You can usually install it with `pip install requests`.")
         return None
@@ -55,6 +65,9 @@ def _get_config(repo_path):
 
 
 def _notify(server, room, token, message, message_format, color="gray"):
+    from requests import post
+    from requests.exceptions import ConnectionError
+
     try:
         post(
             "https://{server}/v2/room/{room}/notification?auth_token={token}".format(
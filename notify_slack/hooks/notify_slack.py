@@ -1,19 +1,21 @@
-try:
-    from configparser import SafeConfigParser
-except ImportError:
-    from ConfigParser import SafeConfigParser
 from json import dumps
 from os.path import exists, join
 
-try:
-    from requests import post
-    from requests.exceptions import ConnectionError
-    REQUESTS = True
-except ImportError:
-    REQUESTS = False
-
 from bundlewrap.utils.ui import io
 
+# repo path -> parsed config (or None if disabled/unusable),
+# so each bw invocation reads the config file only once
+_CONFIGS = {}
+
+
+def _config_parser():
+    # imported lazily to keep bw startup fast when this plugin is idle
+    try:
+        from configparser import SafeConfigParser
+    except ImportError:
+        from ConfigParser import SafeConfigParser
+    return SafeConfigParser()
+
 
 def _check_allowed_groups(config, nodes):
     allowed_nodes = set([])
@@ -33,7 +35,7 @@ def _check_allowed_groups(config, nodes):
 
 def _create_config(path):
     io.debug("writing initial config for Slack notifications to .slack.cfg")
-    config = SafeConfigParser()
+    config = _config_parser()
     config.add_section("configuration")
     config.set("configuration", "enabled", "unconfigured")
     config.set("configuration", "username", "your-slack-username")
@@ -49,10 +51,16 @@ def _create_config(path):
 
 
 def _get_config(repo_path):
+    if repo_path not in _CONFIGS:
+        _CONFIGS[repo_path] = _load_config(repo_path)
+    return _CONFIGS[repo_path]
+
+
+def _load_config(repo_path):
     config_path = join(repo_path, ".slack.cfg")
     if not exists(config_path):
         _create_config(config_path)
-    config = SafeConfigParser()
+    config = _config_parser()
     config.read(config_path)
     if config.get("configuration", "enabled", fallback="unconfigured") == "unconfigured":
         io.stderr("Slack notifications not configured. Please edit .slack.cfg "
@@ -62,7 +70,9 @@ def _get_config(repo_path):
     elif config.get("configuration", "enabled").lower() not in ("yes", "true", "1"):
         io.debug("Slack notifications not enabled in .slack.cfg, skipping...")
         return None
-    elif not REQUESTS:
+    try:
+        import requests  # noqa
+    except ImportError:
         io.stderr("Slack notifications need the requests library. "
                   "You can usually install it with `pip install requests`.")
         return None
@@ -99,6 +109,9 @@ def _notify(url, message=None, title=None, fallback=None, user=None, target=None
     else:
         payload["text"] = message
 
+    from requests import post
+    from requests.exceptions import ConnectionError
+
     try:
         post(
             url,